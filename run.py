@@ -1,36 +1,43 @@
 # Importing required modules
+import asyncio
 import logging
 import os
-import platform
+import re
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dotenv import load_dotenv
 from selenium import webdriver
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 
 
 # Basic configuration for logging
 logging.basicConfig(
     level=logging.INFO,  # Set the logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Format of log messages
+    format='%(asctime)s - %(threadName)s - %(levelname)s - %(message)s',  # Format of log messages
 )
 
 # Loading Environment Variable
 load_dotenv()
-username = os.getenv('USERNAME')
-password = os.getenv('PASSWORD')
 
 # Creating Resume path
 resume_path = os.path.abspath(os.path.join("resume", "Resume.pdf"))
 
-# Login URL
+# Login and Profile URLs
 login_url = "https://www.naukri.com/nlogin/login"
+PROFILE_URL = "https://www.naukri.com/mnjuser/profile"
+
+# Persistent Chrome profiles (one per account) so login sessions survive between runs
+chrome_profiles_dir = os.path.join(os.path.expanduser("~"), ".cache", "naukri_updater", "chrome_profiles")
 
 # Constants
 USERNAME_LOCATOR = "usernameField"
@@ -38,141 +45,321 @@ PASSWORD_LOCATOR = "passwordField"
 LOGIN_BTN_LOCATOR = "//*[@type='submit' and normalize-space()='Login']"
 SKIP_BTN_LOCATOR = "//*[text() = 'SKIP AND CONTINUE']"
 LOGIN_CHECKPOINT_ID = "ff-inventory"
-
+ATTACH_CV_ID = "attachCV"
+
+# Fills the credentials and submits the login form in a single WebDriver call.
+# The native value setter is used so React-controlled inputs pick up the change.
+# Resolves with false if the login button stays disabled after the fields are filled.
+LOGIN_SCRIPT = """
+const [usernameId, passwordId, loginBtnXpath, username, password, timeoutMs, done] = arguments;
+const usernameField = document.getElementById(usernameId);
+const passwordField = document.getElementById(passwordId);
+const loginButton = document.evaluate(
+    loginBtnXpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue;
+if (!usernameField || !passwordField || !loginButton) {
+    done(false);
+    return;
+}
+const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set;
+for (const [field, value] of [[usernameField, username], [passwordField, password]]) {
+    setValue.call(field, value);
+    field.dispatchEvent(new Event("input", {bubbles: true}));
+}
+const deadline = Date.now() + timeoutMs;
+const submit = () => {
+    if (!loginButton.disabled) {
+        loginButton.click();
+        done(true);
+    } else if (Date.now() > deadline) {
+        done(false);
+    } else {
+        setTimeout(submit, 50);
+    }
+};
+submit();
+"""
+
+# Waits (via MutationObserver) until the attach CV input exists or the timeout expires, then closes any pop-up.
+# Once the input exists, keeps observing for a short grace period so pop-ups that render a moment later are closed too.
+# Resolves with whether the attach CV input is present, replacing several WebDriver poll loops with one call.
+UPLOAD_READY_SCRIPT = """
+const [attachId, closeBtnXpath, timeoutMs, graceMs, done] = arguments;
+const findCloseBtn = () => document.evaluate(
+    closeBtnXpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue;
+let finished = false;
+let graceTimer = null;
+const finish = () => {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    clearTimeout(graceTimer);
+    const closeBtn = findCloseBtn();
+    if (closeBtn) {
+        closeBtn.click();
+    }
+    done(document.getElementById(attachId) !== null);
+};
+const check = () => {
+    if (!document.getElementById(attachId)) {
+        return;
+    }
+    if (findCloseBtn()) {
+        finish();
+    } else if (graceTimer === null) {
+        graceTimer = setTimeout(finish, graceMs);
+    }
+};
+const observer = new MutationObserver(check);
+const timer = setTimeout(finish, timeoutMs);
+observer.observe(document, {childList: true, subtree: true});
+check();
+"""
+
+# Returns the text of the first element matching an XPath, or null if it is not present yet
+ELEMENT_TEXT_SCRIPT = """
+const element = document.evaluate(
+    arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue;
+return element ? element.innerText : null;
+"""
+
+PAGE_LOAD_TIMEOUT = 10
 LOGIN_CHECKPOINT_TIMEOUT = 3
+LOGIN_BTN_ENABLED_TIMEOUT = 2
+MAX_WORKERS = 4
 GLOBAL_WAIT = 0.5
-FULLSCREEN_FLAG = False
-
-# Locator Mapping
-locator_mapping = {
-    "ID": By.ID,
-    "NAME": By.NAME,
-    "XPATH": By.XPATH,
-    "TAG": By.TAG_NAME,
-    "CLASS": By.CLASS_NAME,
-    "CSS": By.CSS_SELECTOR,
-    "LINKTEXT": By.LINK_TEXT,
-}
+POLL_FREQ = 0.1
+HEADLESS_FLAG = True
+
+# Chrome switches that skip first-run, sync, extension and background work
+CHROME_STARTUP_ARGS = [
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--mute-audio",
+    "--no-first-run",
+    "--disable-features=Translate",
+]
+
+# Resources not needed by the automation, blocked to lighten page loads.
+# Stylesheets are kept since element visibility checks depend on layout.
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp",
+    "*.woff", "*.woff2", "*.ttf",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+]
+
+
+def get_profile_dir(username):
+    """
+    Get the persistent Chrome profile directory for an account.
+    Args:
+        username: Naukri username.
+    Returns:
+        str: Path to the account's Chrome user data directory.
+    """
+    return os.path.join(chrome_profiles_dir, re.sub(r"[^\w.@-]", "_", username))
 
 
-def get_driver():
+def get_driver(profile_dir=None, url=login_url):
     """
     Open Chrome to load Naukri.com with predefined options.
+    Args:
+        profile_dir: Chrome user data directory to reuse cookies from (optional).
+        url: Page to open once the browser has started (default is the login page).
     Returns:
         WebDriver instance (driver) for interacting with the browser.
     """
     # Set Chrome options
     options = webdriver.ChromeOptions()
     options.add_argument("--disable-notifications")
-    if FULLSCREEN_FLAG:
-        if platform.system == "Windows":
-            options.add_argument("--start-maximized")
-        else:
-            options.add_argument("--kiosk")
-    options.add_argument("--disable-popups")
-    options.add_argument("--disable-gpu")
-
-    # Initialize the Chrome driver with ChromeDriverManager
+    # Skip Chrome subsystems the automation never uses to speed up startup
+    for argument in CHROME_STARTUP_ARGS:
+        options.add_argument(argument)
+    if HEADLESS_FLAG:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+    if profile_dir:
+        options.add_argument(f"--user-data-dir={profile_dir}")
+    # Disable images through content settings as well as the network block below
+    options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    # Return from navigations on DOMContentLoaded; explicit waits cover elements that appear later
+    options.page_load_strategy = "eager"
+
+    # Initialize the Chrome driver; Selenium Manager resolves and caches ChromeDriver
     try:
-        driver = webdriver.Chrome(service=ChromeService(
-            ChromeDriverManager().install()), options=options)
+        driver = webdriver.Chrome(options=options)
         logging.info("ChromeDriver launched")
     except Exception as e:
-        logging.error(f"Error launching Chrome: {e}")
+        logging.error("Error launching Chrome: %s", e)
         return None
 
-    # Set implicit wait time
-    driver.implicitly_wait(5)
+    # Block images, fonts and trackers
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        logging.warning("Unable to block page resources: %s", e)
+
+    # Disable implicit waits; all lookups rely on explicit waits
+    driver.implicitly_wait(0)
 
     # Navigate to site
     try:
-        driver.get(login_url)
-        logging.info("Site loaded successfully")
+        navigate(driver, url)
+        logging.info("Site navigation started")
     except Exception as e:
-        logging.error(f"Error loading site: {e}")
+        logging.error("Error loading site: %s", e)
         driver.quit()
         return None
 
     return driver
 
 
-def is_element_present(driver, how, what):
-    return driver.find_element(by=how, value=what) is not None
+def navigate(driver, url):
+    """
+    Start loading a page without blocking until it has finished loading.
+    Returns as soon as the previous document is replaced, so element waits that follow never match the old page.
+    Args:
+        driver: WebDriver instance.
+        url: Page to open.
+    """
+    old_root = driver.find_element(By.TAG_NAME, "html")
+    result = driver.execute_cdp_cmd("Page.navigate", {"url": url})
+    if result.get("errorText"):
+        raise WebDriverException(f"Navigation to {url} failed: {result['errorText']}")
+    WebDriverWait(driver, PAGE_LOAD_TIMEOUT, poll_frequency=POLL_FREQ).until(EC.staleness_of(old_root))
 
 
-def get_element(driver, element_tag, locator="ID"):
+def get_element(driver, element_tag, by=By.ID):
     """
     Wait up to 15 seconds for an element to be available, then return it.
     Args:
         driver: WebDriver instance.
         element_tag: The tag or identifier of the element to find.
-        locator: The method to locate the element (e.g., "ID", "XPATH").
+        by: The Selenium By strategy to locate the element (e.g., By.ID, By.XPATH).
     Returns:
         WebElement if found, otherwise None.
     """
     try:
-        # Map locator string to the appropriate Selenium By object
-
-        # Define an inner function for retrieving the element
-        def _get_element():
-            if is_element_present(driver, locator_mapping.get(locator), element_tag):
-                return driver.find_element(locator_mapping.get(locator), element_tag)
-            return None
-
-        # Wait for up to 5 seconds for the element to be available
-        element = WebDriverWait(driver, 5).until(lambda d: _get_element())
-
-        if element:
-            return element
-        else:
-            logging.warning(f"Element not found with {locator}: {element_tag}")
-            return None
+        # Wait for up to 5 seconds for the element to be available, polling with a single lookup per tick
+        return WebDriverWait(driver, 5, poll_frequency=POLL_FREQ).until(
+            EC.presence_of_element_located((by, element_tag))
+        )
 
     except (TimeoutException, NoSuchElementException) as e:
-        logging.warning(f"Error finding element with {locator}: {element_tag} - {e}")
+        logging.warning("Error finding element with %s: %s - %s", by, element_tag, e)
     except Exception as e:
-        logging.error(f"Error: {e}")
+        logging.error("Error: %s", e)
 
     return None
 
 
-def wait_until_present(driver, element_tag, locator="ID", timeout=30):
+def _wait_for(driver, condition, by, element_tag, timeout):
     """
-    Wait for an element to be present within the given timeout.
+    Wait for an expected condition on an element within the given timeout.
     Args:
         driver: WebDriver instance.
+        condition: Selenium expected condition factory taking a (by, element_tag) locator.
+        by: The Selenium By strategy to locate the element.
         element_tag: The tag or identifier of the element to find.
-        locator: The method to locate the element (default is "ID").
-        timeout: Maximum wait time in seconds (default is 30 seconds).
+        timeout: Maximum wait time in seconds.
     Returns:
-        bool: True if the element is present, False otherwise.
+        WebElement if the condition was met, otherwise None.
     """
-    locator = locator.upper()
-    driver.implicitly_wait(0)  # Disable implicit wait temporarily
-
     try:
-        # Map locator string to the appropriate Selenium By object
-        by_method = locator_mapping.get(locator)
-
-        # Wait for the element to be present using WebDriverWait
-        WebDriverWait(driver, timeout).until(
-            EC.presence_of_element_located((by_method, element_tag))
+        return WebDriverWait(driver, timeout, poll_frequency=POLL_FREQ).until(
+            condition((by, element_tag))
         )
-        return True
 
     except TimeoutException:
-        logging.warning(f"Element not found with {locator}: {element_tag} within {timeout} seconds.")
-        return False
+        logging.warning(
+            "Condition %s not met with %s: %s within %s seconds.", condition.__name__, by, element_tag, timeout
+        )
     except Exception as e:
-        logging.error(f"Exception in WaitTillElementPresent: {e}")
+        logging.error("Exception while waiting for %s: %s", condition.__name__, e)
+
+    return None
+
+
+def wait_until_present(driver, element_tag, by=By.ID, timeout=30):
+    """
+    Wait for an element to be present within the given timeout.
+    Returns:
+        bool: True if the element is present, False otherwise.
+    """
+    return _wait_for(driver, EC.presence_of_element_located, by, element_tag, timeout) is not None
+
+
+def wait_until_visible(driver, element_tag, by=By.ID, timeout=30):
+    """
+    Wait for an element to be visible within the given timeout, then return it.
+    Returns:
+        WebElement if visible, otherwise None.
+    """
+    return _wait_for(driver, EC.visibility_of_element_located, by, element_tag, timeout)
+
+
+def wait_until_clickable(driver, element_tag, by=By.ID, timeout=30):
+    """
+    Wait for an element to be visible and enabled within the given timeout, then return it.
+    Returns:
+        WebElement if clickable, otherwise None.
+    """
+    return _wait_for(driver, EC.element_to_be_clickable, by, element_tag, timeout)
+
+
+def has_active_session(driver):
+    """
+    Check whether the browser is still logged in, after opening the profile page.
+    Args:
+        driver: WebDriver instance.
+    Returns:
+        bool: True if the profile page loaded, False if Naukri redirected to the login form.
+    """
+    try:
+        # Wait for whichever page Naukri settles on: the profile page or the login form
+        WebDriverWait(driver, PAGE_LOAD_TIMEOUT, poll_frequency=POLL_FREQ).until(EC.any_of(
+            EC.presence_of_element_located((By.ID, ATTACH_CV_ID)),
+            EC.presence_of_element_located((By.ID, USERNAME_LOCATOR)),
+        ))
+    except TimeoutException:
         return False
-    finally:
-        driver.implicitly_wait(3)  # Restore the implicit wait to its default
+    return len(driver.find_elements(By.ID, ATTACH_CV_ID)) > 0
+
+
+def get_credentials():
+    """
+    Read Naukri credentials from the environment.
+    The first account uses USERNAME/PASSWORD, additional accounts use USERNAME_2/PASSWORD_2, USERNAME_3/PASSWORD_3, etc.
+    Returns:
+        list: (username, password) tuples, one per account.
+    """
+    credentials = []
+    suffix = ""
+    index = 1
 
+    while os.getenv(f'USERNAME{suffix}') and os.getenv(f'PASSWORD{suffix}'):
+        credentials.append((os.getenv(f'USERNAME{suffix}'), os.getenv(f'PASSWORD{suffix}')))
+        index += 1
+        suffix = f"_{index}"
 
-def login():
+    return credentials
+
+
+def login(username, password):
     """
     Open Chrome browser and login to Naukri.com.
+    Args:
+        username: Naukri username.
+        password: Naukri password.
     Returns:
         tuple: (status, driver) where status is a boolean indicating success, and driver is the WebDriver instance.
     """
@@ -180,67 +367,93 @@ def login():
     driver = None
 
     try:
-        # Load the Naukri website
-        driver = get_driver()
+        # Load the Naukri profile page with the account's saved browser profile
+        driver = get_driver(get_profile_dir(username), PROFILE_URL)
         if driver is None:
             logging.error("Failed to load the browser.")
             return status, driver
 
+        # Skip the login form if the saved session is still valid
+        if has_active_session(driver):
+            logging.info("Existing session found. Login skipped.")
+            status = True
+            return status, driver
+        # Naukri usually redirects to the login form already; only navigate if it did not
+        if not driver.find_elements(By.ID, USERNAME_LOCATOR):
+            navigate(driver, login_url)
+
+        # Check that the login form is visible while the page is still loading
+        if wait_until_visible(driver, USERNAME_LOCATOR, by=By.ID, timeout=PAGE_LOAD_TIMEOUT) is None:
+            logging.error("Login elements not found. Unable to login.")
+            return status, driver
+
         # Verify if the website loaded correctly
         if "naukri" not in driver.title.lower():
             logging.error("Failed to load Naukri.com correctly.")
             return status, driver
         logging.info("Website Loaded Successfully.")
 
-        # Check and locate the login elements
-        if not is_element_present(driver, By.ID, USERNAME_LOCATOR):
-            logging.error("Login elements not found. Unable to login.")
+        # Fill in credentials and login in a single browser-side script
+        if not driver.execute_async_script(
+            LOGIN_SCRIPT, USERNAME_LOCATOR, PASSWORD_LOCATOR, LOGIN_BTN_LOCATOR, username, password,
+            LOGIN_BTN_ENABLED_TIMEOUT * 1000
+        ):
+            logging.error("Login form not found or submit button stayed disabled. Unable to login.")
             return status, driver
 
-        email_field = get_element(driver, USERNAME_LOCATOR, locator="ID")
-        password_field = get_element(driver, PASSWORD_LOCATOR, locator="ID")
-        login_button = get_element(driver, LOGIN_BTN_LOCATOR, locator="XPATH")
-
-        # Fill in credentials and login
-        email_field.clear()
-        email_field.send_keys(username)
-        password_field.clear()
-        password_field.send_keys(password)
-        login_button.send_keys(Keys.ENTER)
-
         # Handle optional skip button if it appears
-        if wait_until_present(driver, SKIP_BTN_LOCATOR, "XPATH", GLOBAL_WAIT):
-            get_element(driver, SKIP_BTN_LOCATOR, "XPATH").click()
-
-        # Verify successful login
-        if wait_until_present(driver, LOGIN_CHECKPOINT_ID, locator="ID", timeout=LOGIN_CHECKPOINT_TIMEOUT):
+        skip_btn = wait_until_clickable(driver, SKIP_BTN_LOCATOR, By.XPATH, GLOBAL_WAIT)
+        if skip_btn:
+            skip_btn.click()
+
+        # Verify successful login; Naukri lands on the homepage, or back on the profile page
+        # when the login form was reached by a redirect from it
+        try:
+            WebDriverWait(driver, LOGIN_CHECKPOINT_TIMEOUT, poll_frequency=POLL_FREQ).until(EC.any_of(
+                EC.presence_of_element_located((By.ID, LOGIN_CHECKPOINT_ID)),
+                EC.presence_of_element_located((By.ID, ATTACH_CV_ID)),
+            ))
             logging.info("Login Successful")
             status = True
-        else:
-            logging.warn("Login checkpoint not found. Automation may fail")
-        return status, driver
-    except Exception('WebDriverException') as wd_err:
-        logging.error(f"WebDriver Error during login: {wd_err}")
+        except TimeoutException:
+            logging.warning("Login checkpoint not found. Automation may fail")
     except NoSuchElementException as no_elem_err:
-        logging.error(f"Element not found during login: {no_elem_err}")
+        logging.error("Element not found during login: %s", no_elem_err)
+    except WebDriverException as wd_err:
+        logging.error("WebDriver Error during login: %s", wd_err)
     except Exception as e:
-        logging.error(f"Unexpected error during login: {e}")
+        logging.error("Unexpected error during login: %s", e)
 
+    return status, driver
 
-def check_last_update_status(driver, checkpoint_xpath, locator, wait_time):
-    # Check if the resume upload was successful by checking the last updated date
-    if wait_until_present(driver, checkpoint_xpath, locator=locator, timeout=wait_time):
-        checkpoint = get_element(driver, checkpoint_xpath, locator="XPATH")
-        if checkpoint:
-            last_updated_date = checkpoint.text
-            today_f1 = datetime.today().strftime("%b %d, %Y")
-            # Handle single-digit day formatting
-            today_f2 = datetime.today().strftime("%b %#d, %Y")
 
-            if today_f1 in last_updated_date or today_f2 in last_updated_date:
-                logging.info(f"Resume uploaded successfully. Profile update date: {last_updated_date}")
-            else:
-                logging.warning(f"Resume upload failed. Profile update date: {last_updated_date}")
+def check_last_update_status(driver, checkpoint_xpath, wait_time):
+    # Precompute today's date strings once, matching both zero-padded and single-digit day formatting
+    today = datetime.today()
+    month = today.strftime("%b")
+    today_formats = (f"{month} {today.day:02d}, {today.year}", f"{month} {today.day}, {today.year}")
+
+    # Check if the resume upload was successful by checking the last updated date,
+    # reading the checkpoint's presence and text in a single WebDriver call per poll.
+    # The pre-save date is already on the page, so keep polling until it shows today's date.
+    last_seen = {"date": None}
+
+    def _updated_today(d):
+        last_seen["date"] = d.execute_script(ELEMENT_TEXT_SCRIPT, checkpoint_xpath) or last_seen["date"]
+        if last_seen["date"] and any(today_format in last_seen["date"] for today_format in today_formats):
+            return last_seen["date"]
+        return False
+
+    try:
+        last_updated_date = WebDriverWait(
+            driver, wait_time, poll_frequency=POLL_FREQ,
+            # Keep polling if the page re-renders or unloads after saving
+            ignored_exceptions=(JavascriptException, StaleElementReferenceException),
+        ).until(_updated_today)
+        logging.info("Resume uploaded successfully. Profile update date: %s", last_updated_date)
+    except TimeoutException:
+        if last_seen["date"]:
+            logging.warning("Resume upload failed. Profile update date: %s", last_seen["date"])
         else:
             logging.warning("Unable to locate profile update date! Resume upload failed.")
 
@@ -253,35 +466,32 @@ def upload_resume(driver, resume_path):
         resume_path: Path to the resume file to be uploaded.
     """
     # Constants for locators and URLs
-    ATTACH_CV_ID = "attachCV"
     CHECKPOINT_XPATH = "//*[contains(@class, 'updateOn')]"
     SAVE_BTN_XPATH = "//button[@type='button']"
     CLOSE_BTN_XPATH = "//*[contains(@class, 'crossIcon')]"
-    PROFILE_URL = "https://www.naukri.com/mnjuser/profile"
 
     try:
-        driver.get(PROFILE_URL)
-
-        # Close any pop-ups if present
-        if wait_until_present(driver, CLOSE_BTN_XPATH, "XPATH", 1):
-            close_btn = get_element(driver, CLOSE_BTN_XPATH, locator="XPATH")
-            if close_btn:
-                close_btn.click()
-
-        # Wait for the attach CV input field and upload the resume
-        if wait_until_present(driver, ATTACH_CV_ID, locator="ID", timeout=GLOBAL_WAIT):
-            attach_element = get_element(driver, ATTACH_CV_ID, locator="ID")
+        # Login leaves a reused session on the profile page already
+        if not driver.current_url.startswith(PROFILE_URL):
+            navigate(driver, PROFILE_URL)
+
+        # Wait for the attach CV input field and close any pop-ups in a single browser-side call
+        if driver.execute_async_script(
+            UPLOAD_READY_SCRIPT, ATTACH_CV_ID, CLOSE_BTN_XPATH, PAGE_LOAD_TIMEOUT * 1000, GLOBAL_WAIT * 1000
+        ):
+            # Upload the resume
+            attach_element = get_element(driver, ATTACH_CV_ID, by=By.ID)
             attach_element.send_keys(resume_path)
 
         # Save the uploaded resume if the save button is present
-        if wait_until_present(driver, SAVE_BTN_XPATH, locator="XPATH", timeout=GLOBAL_WAIT):
-            save_element = get_element(driver, SAVE_BTN_XPATH, locator="XPATH")
+        save_element = wait_until_clickable(driver, SAVE_BTN_XPATH, by=By.XPATH, timeout=GLOBAL_WAIT)
+        if save_element:
             save_element.click()
-        check_last_update_status(driver, CHECKPOINT_XPATH, "XPATH", 3)
+        check_last_update_status(driver, CHECKPOINT_XPATH, 3)
     except TimeoutException:
         logging.error("Timeout while waiting for elements during resume upload.")
     except Exception as e:
-        logging.error(f"Exception raised while uploading resume: {e}")
+        logging.error("Exception raised while uploading resume: %s", e)
 
 
 def clean_up(driver):
@@ -296,23 +506,53 @@ def clean_up(driver):
             driver.quit()
             logging.info("WebDriver session closed successfully.")
     except Exception as e:
-        logging.warning(f"Error occurred while closing the WebDriver session: {e}")
+        logging.warning("Error occurred while closing the WebDriver session: %s", e)
 
 
-def run_automation():
-    logging.info('Starting Automation...')
+def run_one(credentials):
+    """
+    Login and upload the resume for a single account.
+    Args:
+        credentials: (username, password) tuple for the account.
+    """
+    username, password = credentials
+    driver = None
+    logging.info("Starting Automation for %s...", username)
     try:
-        status, driver = login()
+        status, driver = login(username, password)
         if status:
             if os.path.exists(resume_path):
                 upload_resume(driver, resume_path)
             else:
                 raise FileNotFoundError
     except Exception as ex:
-        logging.error(f"Automation Failed with exception: {ex}")
+        logging.error("Automation Failed for %s with exception: %s", username, ex)
     finally:
         clean_up(driver)
 
 
+async def run_all(credentials_list):
+    """
+    Run the automation for every account concurrently, each with its own browser.
+    Args:
+        credentials_list: List of (username, password) tuples.
+    """
+    if not credentials_list:
+        logging.error("No credentials found. Set USERNAME and PASSWORD in the .env file.")
+        return
+
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=min(len(credentials_list), MAX_WORKERS)) as pool:
+        await asyncio.gather(
+            *[loop.run_in_executor(pool, run_one, credentials) for credentials in credentials_list],
+            return_exceptions=True,
+        )
+
+
+def run_automation():
+    logging.info('Starting Automation...')
+    asyncio.run(run_all(get_credentials()))
+
+
 if __name__ == '__main__':
     run_automation()